@@ -2,7 +2,6 @@
 
 import sys
 import threading
-import queue
 import numpy as np
 import sounddevice as sd
 
@@ -12,6 +11,7 @@ DTYPE = np.float32
 BLOCK_DURATION_MS = 30  # Process audio in 30ms blocks
 SILENCE_THRESHOLD = 0.01  # RMS threshold for silence detection
 SILENCE_DURATION_S = 2.5  # Seconds of silence before auto-stop
+RING_SLACK_BLOCKS = 8  # Extra ring capacity for blocks that arrive while the stream closes
 
 # Beep settings
 BEEP_FREQ_START = 880  # Hz (A5 note) - start recording
@@ -20,17 +20,33 @@ BEEP_DURATION = 0.25  # seconds
 BEEP_SAMPLE_RATE = 44100  # Standard audio output rate
 
 
-def play_beep(frequency: float = BEEP_FREQ_START, duration: float = BEEP_DURATION):
-    """Play a short beep tone."""
-    t = np.linspace(0, duration, int(BEEP_SAMPLE_RATE * duration), False)
+def _make_beep(frequency: float, duration: float) -> np.ndarray:
+    """Generate a stereo beep tone."""
+    n = int(BEEP_SAMPLE_RATE * duration)
+    t = np.linspace(0, duration, n, False)
     # Generate sine wave with fade in/out to avoid clicks
     tone = np.sin(2 * np.pi * frequency * t)
     fade_samples = int(BEEP_SAMPLE_RATE * 0.01)  # 10ms fade
     tone[:fade_samples] *= np.linspace(0, 1, fade_samples)
     tone[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-    tone = (tone * 0.5).astype(np.float32)  # Volume level
     # Convert to stereo for DACs that require it
-    stereo = np.column_stack([tone, tone])
+    stereo = np.empty((n, 2), dtype=np.float32)
+    stereo[:] = (tone * 0.5)[:, None]  # Volume level
+    return stereo
+
+
+# Start/end beeps never change, so build them once at import
+_BEEPS = {
+    (frequency, BEEP_DURATION): _make_beep(frequency, BEEP_DURATION)
+    for frequency in (BEEP_FREQ_START, BEEP_FREQ_END)
+}
+
+
+def play_beep(frequency: float = BEEP_FREQ_START, duration: float = BEEP_DURATION):
+    """Play a short beep tone."""
+    stereo = _BEEPS.get((frequency, duration))
+    if stereo is None:
+        stereo = _make_beep(frequency, duration)
     sd.play(stereo, BEEP_SAMPLE_RATE, blocking=True)
 
 
@@ -46,36 +62,92 @@ class AudioRecorder:
         self.sample_rate = sample_rate
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
-        self._audio_queue: queue.Queue[np.ndarray] = queue.Queue()
         self._stop_event = threading.Event()
+        self._arena: np.ndarray | None = None
+        self._thresh_sq = 0.0
+        # Single-producer/single-consumer ring: only the audio callback advances
+        # _head and only the consumer advances _tail, so no lock is needed.
+        # Sized per recording in record().
+        self._ring = np.empty(0, dtype=DTYPE)
+        self._head = 0
+        self._tail = 0
+        self._data_ready = threading.Event()
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status):
         """Callback for sounddevice stream."""
         if status:
             print(f"Audio status: {status}", file=sys.stderr)
-        self._audio_queue.put(indata.copy())
-
-    def _calculate_rms(self, audio: np.ndarray) -> float:
-        """Calculate RMS (root mean square) of audio for volume detection."""
-        return float(np.sqrt(np.mean(audio**2)))
-
-    def record(self, timeout_seconds: float = 30.0) -> np.ndarray:
+        head = self._head
+        size = len(self._ring)
+        if head - self._tail + frames > size:
+            # The ring holds the whole timeout, so only blocks past the end of
+            # the recording (which are never read) can land here
+            return
+        start = head & (size - 1)
+        first = min(frames, size - start)
+        self._ring[start:start + first] = indata[:first, 0]
+        self._ring[:frames - first] = indata[first:, 0]
+        self._head = head + frames
+        self._data_ready.set()
+
+    def _read_ring(self, out: np.ndarray):
+        """Copy len(out) samples from the ring buffer into out."""
+        n = len(out)
+        size = len(self._ring)
+        start = self._tail & (size - 1)
+        first = min(n, size - start)
+        out[:first] = self._ring[start:start + first]
+        out[first:] = self._ring[:n - first]
+        self._tail += n
+
+    def _sum_of_squares(self, audio: np.ndarray) -> float:
+        """Calculate the sum of squared samples (RMS without the mean and sqrt)."""
+        return float(np.dot(audio, audio))
+
+    def _trailing_silence(self, audio: np.ndarray, block_size: int) -> int:
+        """Count samples in the run of silent blocks at the end of audio."""
+        n_blocks = len(audio) // block_size
+        blocks = audio[:n_blocks * block_size].reshape(n_blocks, block_size)
+        # Per-block sums of squares in one vectorized pass
+        energies = np.einsum("ij,ij->i", blocks, blocks)
+        loud = np.flatnonzero(energies >= self._thresh_sq)
+        silent_blocks = n_blocks if len(loud) == 0 else n_blocks - 1 - int(loud[-1])
+        return silent_blocks * block_size
+
+    def record(self, timeout_seconds: float = 30.0, play_end_beep: bool = True) -> np.ndarray:
         """
         Record audio until silence detected or timeout.
 
+        Args:
+            timeout_seconds: Maximum recording duration
+            play_end_beep: Play the end beep before returning; callers that
+                overlap it with other work pass False and play it themselves
+
         Returns:
             numpy array of recorded audio at 16kHz mono float32
         """
         self._stop_event.clear()
-        self._audio_queue = queue.Queue()
+        self._data_ready.clear()
+        self._head = 0
+        self._tail = 0
 
-        recorded_chunks: list[np.ndarray] = []
         silence_samples = 0
         samples_for_silence = int(self.silence_duration * self.sample_rate)
         total_samples = 0
         max_samples = int(timeout_seconds * self.sample_rate)
 
+        # Preallocate the whole recording so blocks are copied in once, with no final concatenate
+        self._arena = np.empty(max_samples, dtype=DTYPE)
+
         block_size = int(self.sample_rate * BLOCK_DURATION_MS / 1000)
+        # Compare a block's sum of squares against threshold**2 * block_size,
+        # equivalent to rms < threshold
+        self._thresh_sq = self.silence_threshold**2 * block_size
+
+        # Size the ring (a power of two) to hold the whole recording, so a
+        # consumer stalled by GIL contention falls behind but never drops audio
+        ring_samples = max_samples + RING_SLACK_BLOCKS * block_size
+        self._ring = np.empty(1 << (ring_samples - 1).bit_length(), dtype=DTYPE)
 
         # Play beep to indicate recording start
         play_beep(BEEP_FREQ_START)
@@ -88,37 +160,43 @@ class AudioRecorder:
             callback=self._audio_callback,
         ):
             while not self._stop_event.is_set():
-                try:
-                    chunk = self._audio_queue.get(timeout=0.1)
-                    recorded_chunks.append(chunk)
-                    total_samples += len(chunk)
-
-                    # Check for silence
-                    rms = self._calculate_rms(chunk)
-                    if rms < self.silence_threshold:
+                if self._head - self._tail < block_size:
+                    # Woken by the callback as soon as a block lands; the
+                    # timeout only keeps the stop event responsive
+                    self._data_ready.wait(timeout=0.1)
+                    self._data_ready.clear()
+                    continue
+
+                n = min(block_size, max_samples - total_samples)
+                chunk = self._arena[total_samples:total_samples + n]
+                self._read_ring(chunk)
+                total_samples += n
+
+                # Silence can't stop the recording until more than
+                # samples_for_silence samples exist, so skip the check until then
+                if total_samples > samples_for_silence:
+                    if total_samples - n <= samples_for_silence:
+                        # First block past the gate: measure the silent run so far
+                        silence_samples = self._trailing_silence(
+                            self._arena[:total_samples], block_size
+                        )
+                    elif self._sum_of_squares(chunk) < self._thresh_sq:
                         silence_samples += len(chunk)
                     else:
                         silence_samples = 0
 
-                    # Stop if enough silence accumulated (but only after some audio recorded)
-                    if silence_samples >= samples_for_silence and total_samples > samples_for_silence:
+                    # Stop if enough silence accumulated
+                    if silence_samples >= samples_for_silence:
                         print("Silence detected, stopping.", file=sys.stderr)
                         break
 
-                    # Stop if timeout reached
-                    if total_samples >= max_samples:
-                        print("Timeout reached, stopping.", file=sys.stderr)
-                        break
-
-                except queue.Empty:
-                    continue
+                # Stop if timeout reached
+                if total_samples >= max_samples:
+                    print("Timeout reached, stopping.", file=sys.stderr)
+                    break
 
         # Play beep to indicate recording ended
-        play_beep(BEEP_FREQ_END)
-
-        if not recorded_chunks:
-            return np.array([], dtype=DTYPE)
+        if play_end_beep:
+            play_beep(BEEP_FREQ_END)
 
-        # Concatenate all chunks and flatten to 1D
-        audio = np.concatenate(recorded_chunks).flatten()
-        return audio
+        return self._arena[:total_samples]
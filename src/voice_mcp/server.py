@@ -1,12 +1,14 @@
 """MCP server for voice tools (speech-to-text and text-to-speech)."""
 
 import asyncio
+import sys
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from .tools import listen_and_confirm, listen_for_yes_no, speak_and_listen, speak_and_confirm
-from .tts import speak
+from .transcribe import load_model
+from .tts import load_tts, speak
 
 # Create MCP server
 server = Server("voice-mcp")
@@ -261,8 +263,21 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
 
+def _prewarm(loader):
+    """Load a model in the background so the first tool call doesn't wait for it."""
+    try:
+        loader()
+    except Exception as e:
+        print(f"Model prewarm failed: {e}", file=sys.stderr)
+
+
 async def run_server():
     """Run the MCP server."""
+    # Load both models while the client completes the stdio handshake
+    loop = asyncio.get_running_loop()
+    for loader in (load_model, load_tts):
+        loop.run_in_executor(None, _prewarm, loader)
+
     async with stdio_server() as (read_stream, write_stream):
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
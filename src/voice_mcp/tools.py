@@ -1,6 +1,9 @@
 """MCP tool implementations."""
 
-from .audio import AudioRecorder
+import re
+import threading
+
+from .audio import AudioRecorder, BEEP_FREQ_END, play_beep
 from .transcribe import transcribe
 from .tts import speak as tts_speak
 
@@ -9,7 +12,8 @@ YES_PATTERNS = {
     "yes", "yeah", "yep", "yup", "sure", "correct", "right", "affirmative",
     "absolutely", "definitely", "of course", "ok", "okay", "uh huh", "uh-huh",
     "go ahead", "do it", "proceed", "confirm", "confirmed", "that's right",
-    "yes please", "please do", "sounds good", "go for it",
+    "yes please", "please do", "sounds good", "go for it", "alright", "alrighty",
+    "okey-dokey", "why not",
 }
 
 # Words/phrases that indicate "no"
@@ -17,9 +21,66 @@ NO_PATTERNS = {
     "no", "nope", "nah", "negative", "wrong", "incorrect", "don't", "do not",
     "stop", "cancel", "abort", "wait", "hold on", "not yet", "no thanks",
     "no thank you", "i don't think so", "that's wrong", "that's not right",
+    "cancelled", "canceled", "stopped", "aborted", "not really", "not now",
+    "rather not", "let's not", "not at all", "not today", "not this time",
+    "not at this time", "better not", "maybe not", "probably not", "not so fast",
+    "not quite", "not exactly", "not a chance",
 }
 
 
+# Transcript tokens; keeps contractions ("don't") and hyphenations ("uh-huh") whole
+_WORD_RE = re.compile(r"[\w'-]+")
+
+
+def _compile_phrases(patterns: set[str]) -> re.Pattern:
+    """Compile phrases into a single whole-word alternation (longest first)."""
+    alternation = "|".join(map(re.escape, sorted(patterns, key=len, reverse=True)))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+# Single words are matched by set lookup on the transcript's tokens; only
+# multi-word phrases need a regex scan
+_YES_WORDS = frozenset(p for p in YES_PATTERNS if " " not in p)
+_NO_WORDS = frozenset(p for p in NO_PATTERNS if " " not in p)
+_YES_PHRASES = _compile_phrases({p for p in YES_PATTERNS if " " in p})
+_NO_PHRASES = _compile_phrases({p for p in NO_PATTERNS if " " in p})
+
+
+def _classify_yes_no(transcript: str) -> str:
+    """Interpret a lowercased transcript as 'yes', 'no', or 'unclear'."""
+    words = _WORD_RE.findall(transcript)
+    if not _YES_WORDS.isdisjoint(words) or _YES_PHRASES.search(transcript):
+        return "yes"
+    if not _NO_WORDS.isdisjoint(words) or _NO_PHRASES.search(transcript):
+        return "no"
+    return "unclear"
+
+
+def _record_and_transcribe(recorder: AudioRecorder, timeout_seconds: float, beam_size: int = 5) -> dict | None:
+    """
+    Record until silence or timeout, then transcribe while the end beep plays.
+
+    Args:
+        recorder: Recorder configured with the caller's silence duration
+        timeout_seconds: Maximum recording duration
+        beam_size: Whisper beam width (1 for short yes/no answers)
+
+    Returns:
+        dict with 'text' and 'language' keys, or None if no audio was recorded
+    """
+    audio = recorder.record(timeout_seconds=timeout_seconds, play_end_beep=False)
+
+    # The end beep blocks for its full duration, so overlap it with Whisper
+    beep = threading.Thread(target=play_beep, args=(BEEP_FREQ_END,))
+    beep.start()
+    try:
+        if len(audio) == 0:
+            return None
+        return transcribe(audio, beam_size=beam_size)
+    finally:
+        beep.join()
+
+
 def listen_and_confirm(timeout_seconds: int = 30, silence_seconds: float = 2.5) -> dict:
     """
     Record and transcribe user speech for confirmation.
@@ -35,17 +96,15 @@ def listen_and_confirm(timeout_seconds: int = 30, silence_seconds: float = 2.5)
     recorder = AudioRecorder(silence_duration=silence_seconds)
 
     try:
-        audio = recorder.record(timeout_seconds=float(timeout_seconds))
+        result = _record_and_transcribe(recorder, float(timeout_seconds))
 
-        if len(audio) == 0:
+        if result is None:
             return {
                 "transcript": "",
                 "success": False,
                 "error": "No audio recorded",
             }
 
-        result = transcribe(audio)
-
         return {
             "transcript": result["text"],
             "language": result["language"],
@@ -74,9 +133,9 @@ def listen_for_yes_no(timeout_seconds: int = 10, silence_seconds: float = 2.5) -
     recorder = AudioRecorder(silence_duration=silence_seconds)
 
     try:
-        audio = recorder.record(timeout_seconds=float(timeout_seconds))
+        result = _record_and_transcribe(recorder, float(timeout_seconds), beam_size=1)
 
-        if len(audio) == 0:
+        if result is None:
             return {
                 "answer": "unclear",
                 "transcript": "",
@@ -84,23 +143,10 @@ def listen_for_yes_no(timeout_seconds: int = 10, silence_seconds: float = 2.5) -
                 "error": "No audio recorded",
             }
 
-        result = transcribe(audio)
         transcript = result["text"].lower().strip()
 
         # Check for yes/no patterns
-        answer = "unclear"
-
-        # Check exact matches and common phrases
-        for pattern in YES_PATTERNS:
-            if pattern in transcript:
-                answer = "yes"
-                break
-
-        if answer == "unclear":
-            for pattern in NO_PATTERNS:
-                if pattern in transcript:
-                    answer = "no"
-                    break
+        answer = _classify_yes_no(transcript)
 
         return {
             "answer": answer,
@@ -144,9 +190,9 @@ def speak_and_listen(text: str, voice: str = "M1", timeout_seconds: int = 30, si
     silence_seconds = max(2.0, silence_seconds)  # Enforce minimum
     recorder = AudioRecorder(silence_duration=silence_seconds)
     try:
-        audio = recorder.record(timeout_seconds=float(timeout_seconds))
+        result = _record_and_transcribe(recorder, float(timeout_seconds))
 
-        if len(audio) == 0:
+        if result is None:
             return {
                 "spoke": True,
                 "transcript": "",
@@ -154,8 +200,6 @@ def speak_and_listen(text: str, voice: str = "M1", timeout_seconds: int = 30, si
                 "error": "No audio recorded",
             }
 
-        result = transcribe(audio)
-
         return {
             "spoke": True,
             "transcript": result["text"],
@@ -199,9 +243,9 @@ def speak_and_confirm(text: str, voice: str = "M1", timeout_seconds: int = 15, s
     silence_seconds = max(2.0, silence_seconds)  # Enforce minimum
     recorder = AudioRecorder(silence_duration=silence_seconds)
     try:
-        audio = recorder.record(timeout_seconds=float(timeout_seconds))
+        result = _record_and_transcribe(recorder, float(timeout_seconds), beam_size=1)
 
-        if len(audio) == 0:
+        if result is None:
             return {
                 "spoke": True,
                 "answer": "unclear",
@@ -210,22 +254,10 @@ def speak_and_confirm(text: str, voice: str = "M1", timeout_seconds: int = 15, s
                 "error": "No audio recorded",
             }
 
-        result = transcribe(audio)
         transcript = result["text"].lower().strip()
 
         # Check for yes/no patterns
-        answer = "unclear"
-
-        for pattern in YES_PATTERNS:
-            if pattern in transcript:
-                answer = "yes"
-                break
-
-        if answer == "unclear":
-            for pattern in NO_PATTERNS:
-                if pattern in transcript:
-                    answer = "no"
-                    break
+        answer = _classify_yes_no(transcript)
 
         return {
             "spoke": True,
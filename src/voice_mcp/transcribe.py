@@ -1,37 +1,53 @@
 """Whisper transcription wrapper using faster-whisper."""
 
+import os
 import sys
+import threading
 import numpy as np
 from faster_whisper import WhisperModel
 
 # Global model cache
 _model: WhisperModel | None = None
 _model_name: str = ""
+_model_lock = threading.Lock()  # Server prewarm may race the first tool call
+
+# CTranslate2 threads for the int8 kernels. 0 keeps its default (4, or
+# OMP_NUM_THREADS if set); only machines with more than 8 logical CPUs get
+# roughly one thread per physical core
+_cpu_count = os.cpu_count() or 0
+CPU_THREADS = 0 if _cpu_count <= 8 else _cpu_count // 2
 
 
 def load_model(model_name: str = "small") -> WhisperModel:
     """Load Whisper model (cached after first load)."""
     global _model, _model_name
 
-    if _model is not None and _model_name == model_name:
-        return _model
-
-    print(f"Loading Whisper model '{model_name}'...", file=sys.stderr)
-    # Use CPU - GPU requires cuDNN which may not be installed
-    _model = WhisperModel(model_name, device="cpu", compute_type="int8")
-    _model_name = model_name
-    print("Model loaded.", file=sys.stderr)
+    with _model_lock:
+        if _model is not None and _model_name == model_name:
+            return _model
+
+        print(f"Loading Whisper model '{model_name}'...", file=sys.stderr)
+        # Use CPU - GPU requires cuDNN which may not be installed
+        _model = WhisperModel(
+            model_name,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=CPU_THREADS,
+        )
+        _model_name = model_name
+        print("Model loaded.", file=sys.stderr)
 
-    return _model
+        return _model
 
 
-def transcribe(audio: np.ndarray, model_name: str = "small") -> dict:
+def transcribe(audio: np.ndarray, model_name: str = "small", beam_size: int = 5) -> dict:
     """
     Transcribe audio using Whisper.
 
     Args:
         audio: numpy array of audio at 16kHz mono float32
         model_name: Whisper model size (tiny, base, small, medium, large-v3)
+        beam_size: Beam search width (1 = greedy decoding, much faster)
 
     Returns:
         dict with 'text' and 'language' keys
@@ -42,10 +58,10 @@ def transcribe(audio: np.ndarray, model_name: str = "small") -> dict:
     model = load_model(model_name)
 
     # Whisper expects float32 audio normalized to [-1, 1]
-    audio = audio.astype(np.float32)
+    audio = audio.astype(np.float32, copy=False)
 
     # Transcribe - faster-whisper handles audio of any length
-    segments, info = model.transcribe(audio, beam_size=5)
+    segments, info = model.transcribe(audio, beam_size=beam_size)
 
     # Collect all segment texts
     text_parts = []
@@ -1,31 +1,62 @@
 """Text-to-speech using Supertonic."""
 
+import functools
 import sys
+import threading
 import numpy as np
 import sounddevice as sd
 from supertonic import TTS
 
-# Global TTS instance cache
+# Global TTS instance and per-voice style caches
 _tts: TTS | None = None
-_voice_style = None
+_voice_styles: dict[str, object] = {}
+_tts_lock = threading.Lock()  # Server prewarm may race the first tool call
 
-# Audio playback settings
-PLAYBACK_SAMPLE_RATE = 44100  # Supertonic outputs 44.1kHz audio
+# Only prompts up to this length are cached (~7s of speech, ~1.3MB each at
+# 44.1kHz), which bounds the cache at roughly 40MB; longer text is never reused
+SYNTH_CACHE_MAX_CHARS = 100
 
 
 def load_tts() -> TTS:
     """Load TTS model (cached after first load)."""
-    global _tts, _voice_style
+    global _tts
+
+    with _tts_lock:
+        if _tts is not None:
+            return _tts
+
+        print("Loading Supertonic TTS model...", file=sys.stderr)
+        tts = TTS(auto_download=True)
+        _voice_styles["M1"] = tts.get_voice_style(voice_name="M1")
+        _tts = tts
+        print("TTS model loaded.", file=sys.stderr)
 
-    if _tts is not None:
         return _tts
 
-    print("Loading Supertonic TTS model...", file=sys.stderr)
-    _tts = TTS(auto_download=True)
-    _voice_style = _tts.get_voice_style(voice_name="M1")
-    print("TTS model loaded.", file=sys.stderr)
 
-    return _tts
+def _synthesize(tts: TTS, text: str, voice: str) -> tuple[np.ndarray, float]:
+    """Synthesize speech, returning mono float32 audio and its duration in seconds."""
+    # Look up each voice style once
+    voice_style = _voice_styles.get(voice)
+    if voice_style is None:
+        voice_style = _voice_styles[voice] = tts.get_voice_style(voice_name=voice)
+
+    wav, duration = tts.synthesize(text, voice_style=voice_style)
+
+    # Handle output format: wav is (1, samples), duration is array
+    # (asarray/ravel only copy when the dtype or layout requires it)
+    wav = np.asarray(wav, dtype=np.float32).ravel()
+    duration_secs = float(np.asarray(duration).flatten()[0])
+
+    return wav, duration_secs
+
+
+@functools.lru_cache(maxsize=32)
+def _synthesize_cached(tts: TTS, text: str, voice: str) -> tuple[np.ndarray, float]:
+    """Synthesize short prompts once, so repeated questions skip the model."""
+    wav, duration_secs = _synthesize(tts, text, voice)
+    wav.flags.writeable = False  # Shared by every call that hits the cache
+    return wav, duration_secs
 
 
 def speak(text: str, voice: str = "M1") -> dict:
@@ -43,24 +74,17 @@ def speak(text: str, voice: str = "M1") -> dict:
         return {"success": False, "error": "No text provided", "duration": 0}
 
     try:
-        global _voice_style
-
         tts = load_tts()
-
-        # Get voice style if different from cached
-        if voice != "M1" or _voice_style is None:
-            _voice_style = tts.get_voice_style(voice_name=voice)
-
-        # Synthesize speech
-        wav, duration = tts.synthesize(text, voice_style=_voice_style)
-
-        # Handle output format: wav is (1, samples), duration is array
-        wav = np.asarray(wav, dtype=np.float32).flatten()
-        duration_secs = float(np.asarray(duration).flatten()[0])
-
-        # Play audio (stereo for compatibility with DACs)
-        stereo = np.column_stack([wav, wav])
-        sd.play(stereo, PLAYBACK_SAMPLE_RATE, blocking=True)
+        text = text.strip()
+        if len(text) <= SYNTH_CACHE_MAX_CHARS:
+            wav, duration_secs = _synthesize_cached(tts, text, voice)
+        else:
+            wav, duration_secs = _synthesize(tts, text, voice)
+
+        # Play audio (stereo for compatibility with DACs); sounddevice routes
+        # mono data to every mapped channel, so no stereo copy is needed.
+        # Use the model's own output rate so PortAudio never has to resample.
+        sd.play(wav, tts.sample_rate, mapping=[1, 2], blocking=True)
 
         return {
             "success": True,